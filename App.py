@@ -1,9 +1,47 @@
 import pandas as pd
+import numpy as np
 import json
-import re
+from concurrent.futures import ThreadPoolExecutor
+from validation_engine import (
+    RULES, WHITESPACE_CLASS, blank_mask,
+    invalid_age_rating_mask, invalid_country_language_mask, invalid_date_mask,
+)
+
+# Validation pattern (run by the Arrow string kernels, so kept as a plain pattern string)
+ENGLISH_RE = rf'^[a-zA-Z0-9{WHITESPACE_CLASS}.,&()\'"-]*$'
+
+TEXT_COLUMNS = ["Title Name", "Producers", "Directors", "Production Company Name"]
+IMPACT_COLUMNS = ["Violence Impact", "Drug Use Impact", "Themes Impact", "Language Impact", "Nudity Impact", "Sex Impact"]
+
+# Column rules: each reads its own columns and returns a boolean ndarray (True = row fails)
+def rule_non_english(df):
+    # Arrow regex kernel per column; blanks count as English
+    non_english_found = np.zeros(len(df), dtype=bool)
+    for col in TEXT_COLUMNS:
+        non_english_found |= ~df[col].str.match(ENGLISH_RE, na=True).to_numpy(dtype=bool)
+    return non_english_found
+
+def rule_country_language(df):
+    return invalid_country_language_mask(df)
+
+def rule_age_rating(df):
+    return invalid_age_rating_mask(df["Age Rating ID"], RULES.valid_age_ratings)
+
+def rule_date(df):
+    return invalid_date_mask(df["Rating Date"])
+
+def rule_impact_invalid(df):
+    return (~df[IMPACT_COLUMNS].isin(["None", "Low", "Medium", "High"]).to_numpy(dtype=bool)).any(axis=1)
+
+COLUMN_RULES = [rule_non_english, rule_country_language, rule_age_rating, rule_date, rule_impact_invalid]
+
+def flagged_values(series, mask):
+    # {row position: cell} for the flagged rows only; missing cells read as NaN, as in the object-dtype report
+    idx = np.flatnonzero(mask)
+    return dict(zip(idx.tolist(), series.take(idx).to_numpy(dtype=object, na_value=np.nan).tolist()))
 
 def validate_excel(file_path):
-    df = pd.read_excel(file_path, dtype=str)  # Read Excel file as string
+    df = pd.read_excel(file_path, dtype="string[pyarrow]", engine='calamine')  # Read Excel file as Arrow strings
 
     errors = {}
 
@@ -23,70 +61,45 @@ def validate_excel(file_path):
         raise ValueError(f"Missing columns in the Excel file: {missing_cols}")
 
     # Vectorized Duplicate Check for GTI
-    duplicate_gtis = df[df.duplicated(subset=['GTI'], keep=False)]["GTI"].tolist()
-    df["GTI_Duplicate"] = df["GTI"].isin(duplicate_gtis)
+    gti_duplicate = df["GTI"].duplicated(keep=False).to_numpy()
 
     # Vectorized Check for Missing Values (except "Other title names")
-    missing_check = df.isna() | (df == "")
-    required_non_blank_columns = [col for col in required_columns if col != "Other title names"]
-    missing_values = missing_check[required_non_blank_columns].any(axis=1)
-
-    # Vectorized English Character Check
-    english_regex = r'^[a-zA-Z0-9\s.,&()\'"-]*$'
-    text_columns = ["Title Name", "Producers", "Directors", "Production Company Name"]
-    df["Non_English_Found"] = df[text_columns].apply(lambda x: x.str.match(english_regex) == False, axis=1).any(axis=1)
-
-    # Vectorized Numeric Check for 'Countries' and 'Languages'
-    df["Invalid_Country_Language"] = ~df["Countries"].str.isdigit() | ~df["Languages"].str.isdigit()
-
-    # Vectorized Age Rating Validation
-    valid_age_ratings = {"2", "9", "154", "147"}
-    df["Invalid_Age_Rating"] = ~df["Age Rating ID"].isin(valid_age_ratings)
-
-    # Vectorized Date Format Validation (MM/DD/YYYY)
-    date_regex = r"^(0[1-9]|1[0-2])/(0[1-9]|[12][0-9]|3[01])/\d{4}$"
-    df["Invalid_Date_Format"] = ~df["Rating Date"].str.match(date_regex)
-
-    # Vectorized Check for Impact Columns (Shouldn't be blank, can be 'None')
-    impact_columns = ["Violence Impact", "Drug Use Impact", "Themes Impact", "Language Impact", "Nudity Impact", "Sex Impact"]
-    df["Impact_Column_Blank"] = df[impact_columns].apply(lambda x: x.isna() | (x == ""), axis=1).any(axis=1)
-    df["Impact_Column_Invalid"] = ~df[impact_columns].apply(lambda x: x.isin(["None", "Low", "Medium", "High"]), axis=1).all(axis=1)
-
-    # **Collecting Errors Efficiently**
-    df_errors = df.loc[
-        missing_values |
-        df["GTI_Duplicate"] |
-        df["Non_English_Found"] |
-        df["Invalid_Country_Language"] |
-        df["Invalid_Age_Rating"] |
-        df["Invalid_Date_Format"] |
-        df["Impact_Column_Blank"] |
-        df["Impact_Column_Invalid"]
+    # One blank mask over the required columns, reused by the impact-column check below
+    missing_check = blank_mask(df[required_columns])
+    required_non_blank_idx = [i for i, col in enumerate(required_columns) if col != "Other title names"]
+    missing_values = missing_check[:, required_non_blank_idx].any(axis=1)
+
+    # Independent column rules (English text, Countries/Languages, Age Rating ID, Rating Date,
+    # impact values) touch disjoint columns, so run them concurrently
+    with ThreadPoolExecutor(max_workers=len(COLUMN_RULES)) as executor:
+        rule_results = list(executor.map(lambda rule: rule(df), COLUMN_RULES))
+    non_english_found, invalid_country_language, invalid_age_rating, invalid_date_format, impact_column_invalid = rule_results
+
+    # Impact Columns Shouldn't be blank (can be 'None'); reuses the shared blank mask
+    impact_idx = [required_columns.index(col) for col in IMPACT_COLUMNS]
+    impact_column_blank = missing_check[:, impact_idx].any(axis=1)
+
+    # Structuring Error Report as JSON (one pass per error category instead of per row)
+    gti_values = flagged_values(df["GTI"], gti_duplicate)
+    age_rating_values = flagged_values(df["Age Rating ID"], invalid_age_rating)
+    error_categories = [
+        (missing_values, lambda i: "Missing required values"),
+        (gti_duplicate, lambda i: f"Duplicate GTI '{gti_values[i]}'"),
+        (non_english_found, lambda i: "Non-English characters found in text fields"),
+        (invalid_country_language, lambda i: "Non-numeric value found in 'Countries' or 'Languages'"),
+        (invalid_age_rating, lambda i: f"Invalid Age Rating ID '{age_rating_values[i]}' (Allowed: {', '.join(RULES.valid_age_ratings)})"),
+        (invalid_date_format, lambda i: "Invalid date format in 'Rating Date' (Expected: MM/DD/YYYY)"),
+        (impact_column_blank, lambda i: "Impact columns cannot be blank (Allowed: 'None', 'Low', 'Medium', 'High')"),
+        (impact_column_invalid, lambda i: "Impact column contains invalid values (Allowed: 'None', 'Low', 'Medium', 'High')"),
     ]
 
-    # Structuring Error Report as JSON
+    # Stack the flags once (categories x rows) and OR them in a single reduction
+    masks = np.vstack([mask for mask, _ in error_categories])
+    any_error = np.logical_or.reduce(masks, axis=0)
     error_report = {}
-    for index, row in df_errors.iterrows():
-        row_errors = []
-
-        if missing_values.iloc[index]:
-            row_errors.append("Missing required values")
-        if row["GTI_Duplicate"]:
-            row_errors.append(f"Duplicate GTI '{row['GTI']}'")
-        if row["Non_English_Found"]:
-            row_errors.append("Non-English characters found in text fields")
-        if row["Invalid_Country_Language"]:
-            row_errors.append("Non-numeric value found in 'Countries' or 'Languages'")
-        if row["Invalid_Age_Rating"]:
-            row_errors.append(f"Invalid Age Rating ID '{row['Age Rating ID']}' (Allowed: 2, 9, 154, 147)")
-        if row["Invalid_Date_Format"]:
-            row_errors.append(f"Invalid date format in 'Rating Date' (Expected: MM/DD/YYYY)")
-        if row["Impact_Column_Blank"]:
-            row_errors.append("Impact columns cannot be blank (Allowed: 'None', 'Low', 'Medium', 'High')")
-        if row["Impact_Column_Invalid"]:
-            row_errors.append("Impact column contains invalid values (Allowed: 'None', 'Low', 'Medium', 'High')")
-
-        error_report[index + 1] = row_errors  # Use row number (1-based index)
+    for i, row_flags in zip(np.flatnonzero(any_error).tolist(), masks[:, any_error].T.tolist()):
+        # Use row number (1-based index)
+        error_report[i + 1] = [message(i) for (_, message), failed in zip(error_categories, row_flags) if failed]
 
     # Print JSON report
     print(json.dumps(error_report, indent=4))
@@ -6,9 +6,9 @@ def load_file(file_path):
     ext = os.path.splitext(file_path)[-1].lower()  # Extract file extension
     
     if ext == ".xlsx":
-        df = pd.read_excel(file_path, dtype=str)
+        df = pd.read_excel(file_path, dtype="string[pyarrow]", engine='calamine')
     elif ext == ".csv":
-        df = pd.read_csv(file_path, dtype=str)  # Ensure all data is read as strings
+        df = pd.read_csv(file_path, dtype="string[pyarrow]")  # Ensure all data is read as Arrow strings
     else:
         raise ValueError("Invalid file format. Only .xlsx and .csv are supported.")
     
@@ -1,109 +1,53 @@
 from flask import Flask, render_template, request, jsonify
-import pandas as pd
-import re
 import json
-import os
 from pathlib import Path
+from dataclasses import replace
+from validation_engine import RULES, iter_chunks, validate
+from validators_numba import warmup
 
 app = Flask(__name__)
-UPLOAD_FOLDER = "uploads"
+
+# Compile the Numba helpers at startup instead of on the first upload
+warmup()
+
 ALLOWED_EXTENSIONS = {"csv", "xlsx"}
-app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
 
-if not os.path.exists(UPLOAD_FOLDER):
-    os.makedirs(UPLOAD_FOLDER)
+# Report layout: only content descriptors must be non-blank (reported per cell), raw cell values,
+# and blank Age Rating ID / Rating Date are not format errors
+REPORT_RULES = (
+    "missing_content_descriptors", "non_english_chars", "duplicate_gtis",
+    "invalid_country_language", "invalid_age_rating", "invalid_date_format"
+)
+REPORT_KEYS = {"missing_content_descriptors": "blank_cells", "duplicate_gtis": "duplicate_gti"}
+REPORT_CONFIG = replace(RULES, skip_blank_ratings=True, stringify_cells=False)
 
 def allowed_file(filename):
     return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
 
-def validate_file(file_path):
-    file_extension = Path(file_path).suffix.lower()
+def validate_file(file, filename):
+    # `file` is a path or a binary file object; the extension comes from `filename`
+    file_extension = Path(filename).suffix.lower()
     
-    # Load file
+    if file_extension not in (".xlsx", ".csv"):
+        return {"error": "Unsupported file format. Only .xlsx and .csv are allowed."}
+
+    # Read and validate in fixed-size chunks; read errors surface while the chunks are consumed
     try:
-        if file_extension == ".xlsx":
-            df = pd.read_excel(file_path, dtype=str)  # Read as string to prevent type conversion
-        elif file_extension == ".csv":
-            df = pd.read_csv(file_path, dtype=str, encoding="utf-8", errors="ignore")
-        else:
-            return {"error": "Unsupported file format. Only .xlsx and .csv are allowed."}
+        chunks = iter_chunks(file, file_extension=file_extension, encoding="utf-8", encoding_errors="ignore")
+        errors = validate(chunks, rules=REPORT_RULES, config=REPORT_CONFIG, keys=REPORT_KEYS)
     except Exception as e:
         return {"error": str(e)}
-
-    validation_results = {"errors": {}, "warnings": {}}
-
-    # Initialize error categories
-    error_types = [
-        "blank_cells", "non_english_chars", "duplicate_gti",
-        "invalid_country_language", "invalid_age_rating", "invalid_date_format"
+    errors["blank_cells"] = [
+        {"row": error["row"], "column": col, "message": "Cannot be blank (None is allowed)."}
+        for col in REPORT_CONFIG.content_descriptor_columns
+        for error in errors["blank_cells"] if col in error["columns"]
     ]
-    for et in error_types:
-        validation_results["errors"][et] = []
-
-    # Columns where "None" is allowed but not blank
-    non_blank_columns = [
-        "Violence Impact", "Drug Use Impact", "Themes Impact",
-        "Language Impact", "Nudity Impact", "Sex Impact"
+    errors["non_english_chars"] = [
+        {"row": error["row"], "column": error["column"], "value": error["value"]}
+        for error in errors["non_english_chars"]
     ]
-
-    # Rule 1: Check for blank cells (except for other title names)
-    for col in df.columns:
-        if col in non_blank_columns:
-            blank_rows = df[df[col].isna()].index.tolist()
-            for row in blank_rows:
-                validation_results["errors"]["blank_cells"].append(
-                    {"row": row + 2, "column": col, "message": "Cannot be blank (None is allowed)."}
-                )
-    
-    # Rule 2: Check for non-English characters
-    non_english_mask = df.map(lambda x: bool(re.search(r"[^\x00-\x7F]", str(x))) if pd.notna(x) else False)
-    for row, col in zip(*non_english_mask.where(non_english_mask).stack().index.to_list()):
-        validation_results["errors"]["non_english_chars"].append(
-            {"row": row + 2, "column": col, "value": df.at[row, col]}
-        )
-
-    # Rule 3: Find duplicate GTI values and show both rows where found
-    if "GTI" in df.columns:
-        duplicate_gtis = df[df.duplicated("GTI", keep=False)]
-        for gti in duplicate_gtis["GTI"].unique():
-            duplicate_rows = df.index[df["GTI"] == gti].tolist()
-            validation_results["errors"]["duplicate_gti"].append(
-                {"GTI": gti, "rows": [row + 2 for row in duplicate_rows], "value": gti}
-            )
-
-    # Rule 4: Validate Countries and Languages are numeric
-    if "Countries" in df.columns and "Languages" in df.columns:
-        invalid_country_language_mask = ~(
-            df["Countries"].notna() & df["Countries"].str.isnumeric() &
-            df["Languages"].notna() & df["Languages"].str.isnumeric()
-        )
-        invalid_rows = df[invalid_country_language_mask].index.tolist()
-        for row in invalid_rows:
-            validation_results["errors"]["invalid_country_language"].append(
-                {"row": row + 2, "Countries": df.at[row, "Countries"], "Languages": df.at[row, "Languages"]}
-            )
-
-    # Rule 5: Validate Age Rating ID
-    valid_age_ratings = {"2", "9", "154", "147"}
-    if "Age Rating ID" in df.columns:
-        invalid_age_rating_mask = df["Age Rating ID"].notna() & ~df["Age Rating ID"].isin(valid_age_ratings)
-        invalid_rows = df[invalid_age_rating_mask].index.tolist()
-        for row in invalid_rows:
-            validation_results["errors"]["invalid_age_rating"].append(
-                {"row": row + 2, "Age Rating ID": df.at[row, "Age Rating ID"]}
-            )
-
-    # Rule 6: Validate Date format (MM/DD/YYYY)
-    if "Rating Date" in df.columns:
-        date_format = re.compile(r"^\d{2}/\d{2}/\d{4}$")
-        invalid_date_mask = df["Rating Date"].notna() & ~df["Rating Date"].astype(str).str.match(date_format)
-        invalid_rows = df[invalid_date_mask].index.tolist()
-        for row in invalid_rows:
-            validation_results["errors"]["invalid_date_format"].append(
-                {"row": row + 2, "Rating Date": df.at[row, "Rating Date"]}
-            )
-
-    return validation_results
+    errors["duplicate_gti"] = [{**error, "value": error["GTI"]} for error in errors["duplicate_gti"]]
+    return {"errors": errors, "warnings": {}}
 
 @app.route("/", methods=["GET", "POST"])
 def upload_file():
@@ -116,12 +60,8 @@ def upload_file():
             return jsonify({"error": "No selected file"})
 
         if file and allowed_file(file.filename):
-            file_path = os.path.join(app.config["UPLOAD_FOLDER"], file.filename)
-            file.save(file_path)
-
-            # Perform validation
-            validation_results = validate_file(file_path)
-            os.remove(file_path)  # Remove file after processing
+            # Perform validation straight from the upload stream; nothing is written to disk
+            validation_results = validate_file(file.stream, file.filename)
 
             return jsonify(validation_results)
 
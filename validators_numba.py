@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from numba import njit
+
+
+def utf8_buffers(series):
+    """Expose a string column's UTF-8 Arrow buffers as (offsets, data) arrays, with blanks as empty strings.
+
+    fillna("") makes one Arrow-level copy of the column; the returned arrays are views of that copy.
+    """
+    arr = pa.array(series.fillna(""), type=pa.large_string())
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+    _, offsets, data = arr.buffers()
+    offsets = np.frombuffer(offsets, dtype=np.int64)[arr.offset:arr.offset + len(arr) + 1]
+    data = np.frombuffer(data, dtype=np.uint8) if data is not None else np.zeros(0, dtype=np.uint8)
+    return offsets, data
+
+
+@njit(cache=True, nogil=True)
+def all_digits(offsets, data):
+    # True where the cell is non-empty and every byte is ASCII 0-9. Deliberately narrower than
+    # str.isdigit/isnumeric: full-width '１', superscript '²', '½' or '五' are not numeric IDs
+    n = offsets.shape[0] - 1
+    out = np.zeros(n, dtype=np.bool_)
+    for i in range(n):
+        start, end = offsets[i], offsets[i + 1]
+        if start == end:
+            continue
+        ok = True
+        for j in range(start, end):
+            c = data[j]
+            if c < 48 or c > 57:
+                ok = False
+                break
+        out[i] = ok
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _digits(data, start, count):
+    # Integer value of `count` ASCII digits at data[start:], or -1 if any byte is not 0-9
+    value = 0
+    for j in range(start, start + count):
+        c = data[j]
+        if c < 48 or c > 57:
+            return -1
+        value = value * 10 + (c - 48)
+    return value
+
+
+@njit(cache=True, nogil=True)
+def valid_date(offsets, data):
+    # True where the cell is an existing MM/DD/YYYY calendar date (years 0001-9999, leap years honoured)
+    n = offsets.shape[0] - 1
+    out = np.zeros(n, dtype=np.bool_)
+    for i in range(n):
+        start = offsets[i]
+        if offsets[i + 1] - start != 10 or data[start + 2] != 47 or data[start + 5] != 47:
+            continue
+        month = _digits(data, start, 2)
+        day = _digits(data, start + 3, 2)
+        year = _digits(data, start + 6, 4)
+        if month < 1 or month > 12 or day < 1 or year < 1:
+            continue
+        if month == 2:
+            leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+            days = 29 if leap else 28
+        elif month == 4 or month == 6 or month == 9 or month == 11:
+            days = 30
+        else:
+            days = 31
+        out[i] = day <= days
+    return out
+
+
+def warmup():
+    # Compile (or load from cache) every helper on a tiny input; servers call this at startup so the first request pays no JIT cost
+    offsets, data = utf8_buffers(pd.Series(["01/01/2020", "2"], dtype="string[pyarrow]"))
+    all_digits(offsets, data)
+    valid_date(offsets, data)
+